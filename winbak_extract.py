@@ -1,17 +1,34 @@
 #!/usr/bin/env python3
 import argparse
+import ctypes
+import errno
+import functools
+import io
+import itertools
 import os
+import sqlite3
 import sys
 import shutil
-import subprocess
+import threading
 import zipfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import Dict, Iterable, Iterator, List, Tuple
 from datetime import datetime
 
 # Constants
 ZIP_NAME_PREFIX = "Backup files "
+_PREFIX_LOWER = ZIP_NAME_PREFIX.lower()
+_PREFIX_LEN = len(ZIP_NAME_PREFIX)
 TMP_DIR_NAME = ".winbak_tmp"
+PARTS_DB_NAME = "parts.db"
+ZIP_READ_BUFFER_SIZE = 256 * 1024
+MERGE_BUFFER_SIZE = 4 * 1024 * 1024
+MAX_MERGE_JOBS = 8  # default cap; avoids thrashing spinning disks
+MAX_SET_JOBS = 4  # backup folders processed at once in --set mode
+COPY_FILE_FAIL_IF_EXISTS = 0x00000001
+COPY_FILE_NO_BUFFERING = 0x00001000
+WIN32_MERGE_BUFFER_SIZE = 8 * 1024 * 1024
 
 class SummaryLog:
     def __init__(self) -> None:
@@ -50,29 +67,120 @@ class SummaryLog:
         except Exception as exc:
             print(f"Failed to write summary log: {exc}", file=sys.stderr)
 
+# Index of ZIP entries and their part numbers, kept in SQLite under the temp
+# directory so that huge backups never hold every entry in memory
+
+class PartsIndex:
+    BATCH_SIZE = 10000
+
+    def __init__(self, db_path: Path) -> None:
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.db_path = db_path
+        self.conn = sqlite3.connect(to_long_path(db_path))
+        # scratch data: no journal, no fsync
+        self.conn.execute("PRAGMA journal_mode=OFF")
+        self.conn.execute("PRAGMA synchronous=OFF")
+        self.conn.execute("DROP TABLE IF EXISTS parts")
+        # seq follows ZIP order; idx/cnt are filled by number_parts, ok by mark_ok
+        self.conn.execute(
+            "CREATE TABLE parts (seq INTEGER PRIMARY KEY, zip_no INTEGER, entry_no INTEGER,"
+            " dir_key TEXT, name_key TEXT, rel TEXT, size INTEGER, idx INTEGER, cnt INTEGER, ok INTEGER DEFAULT 0)"
+        )
+
+    def _executemany_batched(self, sql: str, rows: Iterable[tuple]) -> None:
+        it = iter(rows)
+        while True:
+            batch = list(itertools.islice(it, self.BATCH_SIZE))
+            if not batch:
+                break
+            with self.conn:
+                self.conn.executemany(sql, batch)
+
+    def add_many(self, rows: Iterable[Tuple[int, int, str, str, str, int]]) -> None:
+        # rows are (zip_no, entry_no, dir_key, name_key, rel, size)
+        self._executemany_batched(
+            "INSERT INTO parts (zip_no, entry_no, dir_key, name_key, rel, size) VALUES (?, ?, ?, ?, ?, ?)", rows
+        )
+
+    def number_parts(self) -> None:
+        # Part indices follow seq, i.e. ZIP order, so numbering stays deterministic
+        with self.conn:
+            self.conn.execute("CREATE INDEX parts_key ON parts (dir_key, name_key, seq)")
+            self.conn.execute("CREATE INDEX parts_zip ON parts (zip_no, seq)")
+            self.conn.execute(
+                "UPDATE parts SET"
+                " idx = (SELECT COUNT(*) FROM parts p WHERE p.dir_key = parts.dir_key AND p.name_key = parts.name_key"
+                " AND p.seq <= parts.seq),"
+                " cnt = (SELECT COUNT(*) FROM parts p WHERE p.dir_key = parts.dir_key AND p.name_key = parts.name_key)"
+            )
+
+    def zip_entries(self, zip_no: int) -> List[Tuple[int, int, str, int, int, int]]:
+        return self.conn.execute(
+            "SELECT seq, entry_no, rel, size, idx, cnt FROM parts WHERE zip_no = ? ORDER BY seq", (zip_no,)
+        ).fetchall()
+
+    def mark_ok(self, seqs: Iterable[int]) -> None:
+        self._executemany_batched("UPDATE parts SET ok = 1 WHERE seq = ?", ((seq,) for seq in seqs))
+
+    def count(self) -> int:
+        return self.conn.execute(
+            "SELECT COUNT(*) FROM (SELECT 1 FROM parts WHERE cnt > 1 AND ok = 1 GROUP BY dir_key, name_key)"
+        ).fetchone()[0]
+
+    def groups(self) -> Iterator[Tuple[Tuple[str, str], List[Tuple[int, Path, int]]]]:
+        # Staged parts that extracted cleanly, largest outputs first so a big merge
+        # does not start last and straggle
+        cur = self.conn.execute(
+            "SELECT p.dir_key, p.name_key, p.idx, p.rel, p.size FROM parts p"
+            " JOIN (SELECT dir_key, name_key, SUM(size) AS total FROM parts WHERE cnt > 1 AND ok = 1"
+            " GROUP BY dir_key, name_key) g USING (dir_key, name_key)"
+            " WHERE p.cnt > 1 AND p.ok = 1"
+            " ORDER BY g.total DESC, p.dir_key, p.name_key, p.idx"
+        )
+        for key, rows in itertools.groupby(cur, key=lambda r: (r[0], r[1])):
+            yield key, [(idx, Path(rel), size) for _, _, idx, rel, size in rows]
+
+    def close(self) -> None:
+        try:
+            self.conn.close()
+        finally:
+            try:
+                os.unlink(to_long_path(self.db_path))
+            except OSError:
+                pass
+
 # Windows extended-length path helper
 # Note: Path operations with \\?\ prefix require absolute paths.
 
-def to_long_path(p: Path) -> str:
-    p_abs = p.resolve(strict=False)
-    s = str(p_abs)
+def to_long_path_fast(abs_str: str) -> str:
+    # abs_str must already be absolute and normalized; only the prefix is added
     if os.name == "nt":
-        if not s.startswith("\\\\?\\"):
+        if not abs_str.startswith("\\\\?\\"):
             # Convert to extended-length form
-            if s.startswith("\\\\"):
+            if abs_str.startswith("\\\\"):
                 # UNC path
-                return "\\\\?\\UNC" + s[1:]
+                return "\\\\?\\UNC" + abs_str[1:]
             else:
-                return "\\\\?\\" + s
-    return s
+                return "\\\\?\\" + abs_str
+    return abs_str
+
+def to_long_path(p: Path) -> str:
+    # resolve() costs filesystem calls; absolute paths only need normalizing
+    s = os.path.normpath(p) if p.is_absolute() else str(p.resolve(strict=False))
+    return to_long_path_fast(s)
+
+# Name filter: only the prefix-length head and the extension are lowercased
+
+def is_backup_zip_name(name: str) -> bool:
+    return name[:_PREFIX_LEN].lower() == _PREFIX_LOWER and name[-4:].lower() == ".zip"
 
 # Natural sort for ZIPs by trailing integer after prefix
 
 def zip_sort_key(p: Path) -> Tuple[int, str]:
     name = p.name
     try:
-        if name.lower().startswith(ZIP_NAME_PREFIX.lower()):
-            suffix = name[len(ZIP_NAME_PREFIX):]
+        if name[:_PREFIX_LEN].lower() == _PREFIX_LOWER:
+            suffix = name[_PREFIX_LEN:]
             num = int(Path(suffix).stem)  # handles "N.zip"
             return (num, name)
     except Exception:
@@ -88,7 +196,22 @@ def parse_args(argv: List[str]) -> argparse.Namespace:
     g.add_argument("--files", nargs="+", help="Explicit ZIP paths")
     g.add_argument("--set", type=str, help="Parent folder containing multiple 'Backup Files' folders")
     ap.add_argument("--encoding", type=str, help="Filename encoding to use when ZIP is not UTF-8 (e.g., 'cp932')")
-    return ap.parse_args(argv)
+    ap.add_argument("--jobs", type=int, help=f"Number of files to merge concurrently (default: min({MAX_MERGE_JOBS}, CPU count))")
+    args = ap.parse_args(argv)
+    if args.jobs is not None and args.jobs < 1:
+        ap.error("--jobs must be at least 1")
+    return args
+
+# Collect backup ZIPs directly inside a folder; os.scandir gives file type from
+# the directory listing itself, so no extra stat per entry
+
+def scan_zip_dir(root: Path) -> List[Path]:
+    zips: List[Path] = []
+    with os.scandir(root) as it:
+        for e in it:
+            if is_backup_zip_name(e.name) and e.is_file():
+                zips.append(Path(e.path))
+    return zips
 
 # Enumerate and validate ZIPs
 
@@ -98,13 +221,11 @@ def enumerate_zips(args: argparse.Namespace) -> List[Path]:
         root = Path(args.dir)
         if not root.is_dir():
             raise FileNotFoundError(f"Directory not found: {root}")
-        for p in root.iterdir():
-            if p.is_file() and p.suffix.lower() == ".zip" and p.name.lower().startswith(ZIP_NAME_PREFIX.lower()):
-                zips.append(p)
+        zips = scan_zip_dir(root)
     else:
         for f in getattr(args, 'files', []) or []:
             p = Path(f)
-            if p.is_file() and p.suffix.lower() == ".zip" and p.name.lower().startswith(ZIP_NAME_PREFIX.lower()):
+            if is_backup_zip_name(p.name) and p.is_file():
                 zips.append(p)
     return zips
 
@@ -112,13 +233,19 @@ def enumerate_zips(args: argparse.Namespace) -> List[Path]:
 
 # Filename decoding per flags and user encoding
 
-def _decode_zip_name(info: zipfile.ZipInfo, user_encoding: str | None) -> str:
-    if info.flag_bits & 0x800:
-        return info.orig_filename
+@functools.lru_cache(maxsize=None)
+def _is_ascii_compatible(encoding: str) -> bool:
     try:
-        raw = info.orig_filename.encode('cp437')
+        return bytes(range(128)).decode(encoding) == bytes(range(128)).decode('ascii')
     except Exception:
-        return info.orig_filename
+        return False
+
+@functools.lru_cache(maxsize=4096)
+def _decode_legacy_name(orig_filename: str, user_encoding: str | None) -> str:
+    try:
+        raw = orig_filename.encode('cp437')
+    except Exception:
+        return orig_filename
     if user_encoding:
         try:
             return raw.decode(user_encoding)
@@ -127,139 +254,503 @@ def _decode_zip_name(info: zipfile.ZipInfo, user_encoding: str | None) -> str:
     try:
         return raw.decode('cp437')
     except Exception:
+        return orig_filename
+
+def _decode_zip_name(info: zipfile.ZipInfo, user_encoding: str | None) -> str:
+    if info.flag_bits & 0x800:
         return info.orig_filename
+    # ASCII names decode to themselves; skip the encode/decode round-trip
+    if info.orig_filename.isascii() and (not user_encoding or _is_ascii_compatible(user_encoding)):
+        return info.orig_filename
+    return _decode_legacy_name(info.orig_filename, user_encoding)
 
 # Extraction staging under temp directory
 
-def stage_extract(zips: List[Path], dest_root: Path, log: SummaryLog, user_encoding: str | None = None) -> Dict[str, List[Path]]:
-    parts_map: Dict[str, List[Path]] = {}
+def _part_path(tmp_long: str, rel: Path, idx: int) -> str:
+    # staged part location under the temp directory, shared by staging and merging
+    rel_parent = str(rel.parent)
+    part_dir = os.path.join(tmp_long, rel_parent) if rel_parent != "." else tmp_long
+    return os.path.join(part_dir, rel.name + f".part_{idx:04d}")
+
+def stage_extract(zips: List[Path], dest_root: Path, parts_index: PartsIndex, log: SummaryLog, user_encoding: str | None = None) -> None:
+    # zips and dest_root are resolved once by process_zips; paths below are long-path strings
     tmp_root = dest_root / TMP_DIR_NAME
     tmp_root.mkdir(parents=True, exist_ok=True)
     total_zips = len(zips)
-    for i, zp in enumerate(zips, start=1):
-        # progress: show which ZIP is being processed
-        try:
-            print(f"Processing ZIP {i}/{total_zips}: {zp.name}", file=sys.stderr, flush=True)
-        except Exception:
-            # best-effort progress printing; don't fail extraction if print fails
-            pass
+    zip_longs = [to_long_path_fast(str(zp)) for zp in zips]
+    # Pre-scan: record every entry in the index, one ZIP's infolist at a time.
+    # Each ZIP is closed again right away: direct vs staged depends on counts
+    # across all ZIPs, so holding the handles until extraction would mean holding
+    # every ZIP and its infolist at once. Extraction parses each central
+    # directory a second time instead.
+    # lowered + interned directory component, shared by every entry in that directory
+    dir_keys: Dict[str, str] = {}
+    for zip_no, (zp, zp_long) in enumerate(zip(zips, zip_longs), start=1):
+        rows: List[Tuple[int, int, str, str, str, int]] = []
         try:
-            with zipfile.ZipFile(to_long_path(zp)) as zf:
-                for info in zf.infolist():
+            with zipfile.ZipFile(zp_long) as zf:
+                for entry_no, info in enumerate(zf.infolist()):
                     if info.is_dir():
                         continue
                     fixed_name = _decode_zip_name(info, user_encoding or None)
                     rel = Path(fixed_name)
-                    key = str(rel).lower()  # case-insensitive grouping
-                    part_list = parts_map.setdefault(key, [])
-                    idx = len(part_list) + 1
-                    part_name = rel.name + f".part_{idx:04d}"
-                    part_dir = tmp_root / rel.parent
-                    part_dir.mkdir(parents=True, exist_ok=True)
-                    part_path = part_dir / part_name
-                    with zf.open(info, "r") as src, open(to_long_path(part_path), "wb", buffering=1024 * 1024) as dst:
-                        shutil.copyfileobj(src, dst, length=1024 * 1024)
-                    part_list.append(part_path)
-                    log.extracted_parts_count += 1
+                    parent = str(rel.parent)
+                    dir_key = dir_keys.get(parent)
+                    if dir_key is None:
+                        dir_key = dir_keys[parent] = sys.intern(parent.lower())
+                    # case-insensitive grouping
+                    rows.append((zip_no, entry_no, dir_key, rel.name.lower(), str(rel), info.file_size))
         except Exception as exc:
             log.errors.append(f"Failed to extract from {zp}: {exc}")
-    return parts_map
+        parts_index.add_many(rows)
+    parts_index.number_parts()
+
+    # Keys seen only once skip staging and stream straight to their final path;
+    # multi-part keys are staged under tmp_root for merge_parts.
+    # Long-path prefixes are computed once; children are plain string joins.
+    dest_long = to_long_path_fast(str(dest_root))
+    tmp_long = os.path.join(dest_long, TMP_DIR_NAME)
+    made_dirs = {tmp_long}
+    lock = threading.Lock()
+    # seqs of staged parts extracted cleanly; flushed to the index by this thread
+    ok_seqs: List[int] = []
+    # The submitting loop reopens each ZIP and the worker finishing its last
+    # entry closes it; with a bounded number of entries in flight only a few ZIPs
+    # are open at a time. The per-ZIP lock serializes open/close of members, which
+    # update unlocked bookkeeping; member reads are locked by zipfile itself.
+    archives: Dict[int, Tuple[zipfile.ZipFile, threading.Lock]] = {}
+    remaining: Dict[int, int] = {}
+
+    def release_zip(zip_no: int) -> None:
+        zf, zf_lock = archives[zip_no]
+        with zf_lock:
+            remaining[zip_no] -= 1
+            if remaining[zip_no]:
+                return
+        del archives[zip_no]
+        zf.close()
+
+    def extract_one(job: Tuple[Path, int, zipfile.ZipInfo, Path, str, bool, int]) -> None:
+        zp, zip_no, info, rel, target_long, direct, seq = job
+        try:
+            # "xb" enforces the overwrite policy atomically for direct outputs
+            mode = "xb" if direct else "wb"
+            with open(target_long, mode, buffering=1024 * 1024) as dst:
+                # empty entries are just created; no need to start the decompressor
+                if info.file_size > 0:
+                    try:
+                        zf, zf_lock = archives[zip_no]
+                        with zf_lock:
+                            src = io.BufferedReader(zf.open(info, "r"), buffer_size=ZIP_READ_BUFFER_SIZE)
+                        try:
+                            shutil.copyfileobj(src, dst, length=min(info.file_size, MERGE_BUFFER_SIZE))
+                        finally:
+                            with zf_lock:
+                                src.close()
+                    except Exception:
+                        if direct:
+                            # never leave a truncated file at a final path
+                            dst.close()
+                            try:
+                                os.unlink(target_long)
+                            except OSError:
+                                pass
+                        raise
+            with lock:
+                log.extracted_parts_count += 1
+                if direct:
+                    log.merged.append((str(dest_root / rel), 1))
+                else:
+                    ok_seqs.append(seq)
+        except FileExistsError:
+            final_path = dest_root / rel
+            with lock:
+                log.skipped_existing.append(str(final_path))
+                log.errors.append(f"Final already exists (overwrite not allowed): {final_path}")
+        except Exception as exc:
+            with lock:
+                log.errors.append(f"Failed to extract {info.filename} from {zp}: {exc}")
 
-# Python fallback concatenation to avoid cmd copy /b limitations
+    def flush_ok() -> None:
+        with lock:
+            done = ok_seqs[:]
+            del ok_seqs[:]
+        parts_index.mark_ok(done)
 
-def concat_parts_python(parts: List[Path], tmp_merge: Path) -> None:
-    tmp_merge.parent.mkdir(parents=True, exist_ok=True)
-    with open(to_long_path(tmp_merge), 'wb', buffering=1024*1024) as out:
-        for p in parts:
-            with open(to_long_path(p), 'rb', buffering=1024*1024) as inp:
-                shutil.copyfileobj(inp, out, length=1024*1024)
+    workers = os.cpu_count() or 1
+    slots = threading.BoundedSemaphore(workers * 2)
 
-# Merge parts using copy /b, verify size, handle overwrite policy
+    def run(job: Tuple[Path, int, zipfile.ZipInfo, Path, str, bool, int]) -> None:
+        try:
+            extract_one(job)
+        finally:
+            release_zip(job[1])
+            slots.release()
 
-def merge_parts(parts_map: Dict[str, List[Path]], dest_root: Path, log: SummaryLog) -> None:
-    tmp_root = dest_root / TMP_DIR_NAME
-    total_items = len(parts_map)
-    for idx, (key, parts) in enumerate(parts_map.items(), start=1):
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            for zip_no, (zp, zp_long) in enumerate(zip(zips, zip_longs), start=1):
+                # progress: show which ZIP is being processed
+                try:
+                    print(f"Processing ZIP {zip_no}/{total_zips}: {zp.name}", file=sys.stderr, flush=True)
+                except Exception:
+                    # best-effort progress printing; don't fail extraction if print fails
+                    pass
+                flush_ok()
+                rows = parts_index.zip_entries(zip_no)
+                if not rows:
+                    continue
+                try:
+                    zf = zipfile.ZipFile(zp_long)
+                except Exception as exc:
+                    with lock:
+                        log.errors.append(f"Failed to extract from {zp}: {exc}")
+                    continue
+                infos = zf.infolist()
+                jobs = []
+                for seq, entry_no, rel_str, _, idx, cnt in rows:
+                    rel = Path(rel_str)
+                    direct = cnt == 1
+                    if direct:
+                        rel_parent = str(rel.parent)
+                        target_dir = os.path.join(dest_long, rel_parent) if rel_parent != "." else dest_long
+                        target_long = os.path.join(target_dir, rel.name)
+                    else:
+                        target_long = _part_path(tmp_long, rel, idx)
+                        target_dir = os.path.dirname(target_long)
+                    if target_dir not in made_dirs:
+                        try:
+                            os.makedirs(target_dir, exist_ok=True)
+                        except Exception as exc:
+                            with lock:
+                                log.errors.append(f"Failed to create {target_dir}: {exc}")
+                            continue
+                        made_dirs.add(target_dir)
+                    jobs.append((zp, zip_no, infos[entry_no], rel, target_long, direct, seq))
+                del rows, infos
+                if not jobs:
+                    zf.close()
+                    continue
+                archives[zip_no] = (zf, threading.Lock())
+                remaining[zip_no] = len(jobs)
+                for job in jobs:
+                    slots.acquire()
+                    ex.submit(run, job)
+                del jobs
+    finally:
+        # only left open if submitting stopped early
+        for zf, _ in list(archives.values()):
+            try:
+                zf.close()
+            except Exception:
+                pass
+
+    # file_size is exact once extraction succeeded (zipfile checks length and CRC),
+    # so the recorded sizes of ok parts are what merge_parts expects
+    flush_ok()
+
+# Best-effort preallocation of the merge output to reduce fragmentation
+
+def _preallocate(fd: int, size: int) -> None:
+    if size <= 0:
+        return
+    try:
+        if hasattr(os, "posix_fallocate"):
+            os.posix_fallocate(fd, 0, size)
+        else:
+            os.ftruncate(fd, size)  # e.g. macOS: extend without reserving blocks
+    except OSError:
+        pass
+
+# Open a part for one front-to-back read, hinting the OS to enlarge readahead
+# (POSIX only; the Windows backend passes FILE_FLAG_SEQUENTIAL_SCAN itself)
+
+def _open_sequential(path: str) -> io.FileIO:
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        if hasattr(os, "posix_fadvise"):
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            except OSError:
+                pass
+        return open(fd, 'rb', buffering=0)
+    except BaseException:
+        os.close(fd)
+        raise
+
+# Concatenate parts in order, double-buffered: a writer thread drains one
+# buffer while the next chunk is read into the other (no per-chunk allocation)
+
+def concat_parts_python(parts: List[str], tmp_merge: str, expected: int) -> int:
+    bufs = (bytearray(MERGE_BUFFER_SIZE), bytearray(MERGE_BUFFER_SIZE))
+    views = (memoryview(bufs[0]), memoryview(bufs[1]))
+    # raw fd + os.write: no file object layer between the buffers and the syscall
+    # 0o666 matches open(..., 'wb'); umask applies as usual
+    fd = os.open(tmp_merge, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        with ThreadPoolExecutor(max_workers=1) as writer:
+            def write_all(mv: memoryview) -> None:
+                written = 0
+                while written < len(mv):
+                    written += os.write(fd, mv[written:])
+
+            _preallocate(fd, expected)
+            total = 0
+            pending = None
+            cur = 0
+            for p in parts:
+                with _open_sequential(p) as inp:
+                    while True:
+                        n = inp.readinto(bufs[cur])
+                        if not n:
+                            break
+                        # the other buffer must be written out before it is refilled
+                        if pending is not None:
+                            pending.result()
+                        pending = writer.submit(write_all, views[cur][:n])
+                        total += n
+                        cur ^= 1
+            if pending is not None:
+                pending.result()
+        # drop any preallocated tail so the caller's size check stays honest
+        os.ftruncate(fd, total)
+        # merged output is not read again; keep it from crowding the page cache
+        if hasattr(os, "posix_fadvise"):
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+            except OSError:
+                pass
+    finally:
+        os.close(fd)
+    return total
+
+# Windows: concatenate on raw HANDLEs with ReadFile/WriteFile (no Python file layers)
+
+@functools.lru_cache(maxsize=None)
+def _kernel32() -> "ctypes.WinDLL":
+    from ctypes import wintypes
+    k32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    k32.CreateFileW.argtypes = [wintypes.LPCWSTR, wintypes.DWORD, wintypes.DWORD, wintypes.LPVOID, wintypes.DWORD, wintypes.DWORD, wintypes.HANDLE]
+    k32.CreateFileW.restype = wintypes.HANDLE
+    k32.ReadFile.argtypes = [wintypes.HANDLE, wintypes.LPVOID, wintypes.DWORD, ctypes.POINTER(wintypes.DWORD), wintypes.LPVOID]
+    k32.ReadFile.restype = wintypes.BOOL
+    k32.WriteFile.argtypes = [wintypes.HANDLE, wintypes.LPCVOID, wintypes.DWORD, ctypes.POINTER(wintypes.DWORD), wintypes.LPVOID]
+    k32.WriteFile.restype = wintypes.BOOL
+    k32.SetFilePointerEx.argtypes = [wintypes.HANDLE, wintypes.LARGE_INTEGER, ctypes.POINTER(wintypes.LARGE_INTEGER), wintypes.DWORD]
+    k32.SetFilePointerEx.restype = wintypes.BOOL
+    k32.SetEndOfFile.argtypes = [wintypes.HANDLE]
+    k32.SetEndOfFile.restype = wintypes.BOOL
+    k32.CloseHandle.argtypes = [wintypes.HANDLE]
+    k32.CloseHandle.restype = wintypes.BOOL
+    k32.VirtualAlloc.argtypes = [wintypes.LPVOID, ctypes.c_size_t, wintypes.DWORD, wintypes.DWORD]
+    k32.VirtualAlloc.restype = wintypes.LPVOID
+    k32.VirtualFree.argtypes = [wintypes.LPVOID, ctypes.c_size_t, wintypes.DWORD]
+    k32.VirtualFree.restype = wintypes.BOOL
+    k32.CopyFileExW.argtypes = [wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.LPVOID, wintypes.LPVOID, ctypes.POINTER(wintypes.BOOL), wintypes.DWORD]
+    k32.CopyFileExW.restype = wintypes.BOOL
+    return k32
+
+def _win32_open(k32: "ctypes.WinDLL", path: str, write: bool) -> int:
+    GENERIC_READ, GENERIC_WRITE = 0x80000000, 0x40000000
+    FILE_SHARE_READ = 0x00000001
+    CREATE_ALWAYS, OPEN_EXISTING = 2, 3
+    FILE_FLAG_SEQUENTIAL_SCAN = 0x08000000
+    if write:
+        h = k32.CreateFileW(path, GENERIC_WRITE, 0, None, CREATE_ALWAYS, FILE_FLAG_SEQUENTIAL_SCAN, None)
+    else:
+        h = k32.CreateFileW(path, GENERIC_READ, FILE_SHARE_READ, None, OPEN_EXISTING, FILE_FLAG_SEQUENTIAL_SCAN, None)
+    if h is None or h == ctypes.c_void_p(-1).value:
+        raise ctypes.WinError(ctypes.get_last_error(), path)
+    return h
+
+def _concat_parts_win32(parts: List[str], tmp_merge: str, expected: int) -> int:
+    # Same double-buffering as concat_parts_python: ctypes releases the GIL around
+    # ReadFile/WriteFile, so the writer thread overlaps with the next read
+    MEM_COMMIT, MEM_RESERVE, MEM_RELEASE, PAGE_READWRITE = 0x1000, 0x2000, 0x8000, 0x04
+    FILE_BEGIN = 0
+    k32 = _kernel32()
+    # VirtualAlloc returns page-aligned memory
+    bufs: List[int] = []
+    try:
+        for _ in range(2):
+            buf = k32.VirtualAlloc(None, WIN32_MERGE_BUFFER_SIZE, MEM_COMMIT | MEM_RESERVE, PAGE_READWRITE)
+            if not buf:
+                raise ctypes.WinError(ctypes.get_last_error())
+            bufs.append(buf)
+        out = _win32_open(k32, tmp_merge, write=True)
+        try:
+            # Preallocate, then rewind
+            if expected > 0 and k32.SetFilePointerEx(out, expected, None, FILE_BEGIN):
+                k32.SetEndOfFile(out)
+                k32.SetFilePointerEx(out, 0, None, FILE_BEGIN)
+            # leaving the with block waits for the last write, even on error
+            with ThreadPoolExecutor(max_workers=1) as writer:
+                def write_all(addr: int, n: int) -> None:
+                    n_written = ctypes.c_ulong(0)
+                    done = 0
+                    while done < n:
+                        if not k32.WriteFile(out, addr + done, n - done, ctypes.byref(n_written), None):
+                            raise ctypes.WinError(ctypes.get_last_error(), tmp_merge)
+                        done += n_written.value
+
+                total = 0
+                pending = None
+                cur = 0
+                n_read = ctypes.c_ulong(0)
+                for p in parts:
+                    inp = _win32_open(k32, p, write=False)
+                    try:
+                        while True:
+                            if not k32.ReadFile(inp, bufs[cur], WIN32_MERGE_BUFFER_SIZE, ctypes.byref(n_read), None):
+                                raise ctypes.WinError(ctypes.get_last_error(), p)
+                            n = n_read.value
+                            if n == 0:
+                                break
+                            # the other buffer must be written out before it is refilled
+                            if pending is not None:
+                                pending.result()
+                            pending = writer.submit(write_all, bufs[cur], n)
+                            total += n
+                            cur ^= 1
+                    finally:
+                        k32.CloseHandle(inp)
+                if pending is not None:
+                    pending.result()
+            # drop any preallocated tail so the caller's size check stays honest
+            if not k32.SetEndOfFile(out):
+                raise ctypes.WinError(ctypes.get_last_error(), tmp_merge)
+            return total
+        finally:
+            k32.CloseHandle(out)
+    finally:
+        for buf in bufs:
+            k32.VirtualFree(buf, 0, MEM_RELEASE)
+
+# Pick the concatenation backend for this platform
+
+def concat_parts(parts: List[str], tmp_merge: str, expected: int) -> int:
+    # returns the number of bytes written
+    if os.name == "nt":
+        return _concat_parts_win32(parts, tmp_merge, expected)
+    return concat_parts_python(parts, tmp_merge, expected)
+
+# Move a finished file into place; falls back to a copy when src and dst are on
+# different volumes (os.replace cannot cross volumes)
+
+def _move_file(src: str, dst: str) -> None:
+    try:
+        os.replace(src, dst)
+        return
+    except OSError as exc:
+        if exc.errno != errno.EXDEV:
+            raise
+    if os.name == "nt":
+        # Unbuffered kernel copy, as used by xcopy /j for large files
+        if not _kernel32().CopyFileExW(src, dst, None, None, None, COPY_FILE_NO_BUFFERING | COPY_FILE_FAIL_IF_EXISTS):
+            raise ctypes.WinError(ctypes.get_last_error())
+    else:
+        # "xb" fails if dst exists, matching COPY_FILE_FAIL_IF_EXISTS
+        with open(src, "rb") as fsrc, open(dst, "xb") as fdst:
+            try:
+                shutil.copyfileobj(fsrc, fdst, length=MERGE_BUFFER_SIZE)
+            except Exception:
+                fdst.close()
+                try:
+                    os.unlink(dst)
+                except OSError:
+                    pass
+                raise
+    os.unlink(src)
+
+# Merge parts, verify size, handle overwrite policy
+
+def merge_parts(parts_index: PartsIndex, dest_root: Path, log: SummaryLog, jobs: int | None = None) -> None:
+    # dest_root is resolved by process_zips; each part is (part index, relative path, size)
+    dest_str = str(dest_root)
+    dest_long = to_long_path_fast(dest_str)
+    tmp_long = os.path.join(dest_long, TMP_DIR_NAME)
+    total_items = parts_index.count()
+    # Outputs are independent; guard shared log lists across worker threads
+    lock = threading.Lock()
+
+    def merge_one(item: Tuple[int, Tuple[Tuple[str, str], List[Tuple[int, Path, int]]]]) -> None:
+        idx, (key, staged) = item
+        parts = [_part_path(tmp_long, rel, part_idx) for part_idx, rel, _ in staged]
         try:
             first_part = parts[0]
-            original_name = first_part.name.rsplit(".part_", 1)[0]
+            rel = staged[0][1]
+            part_dir = os.path.dirname(first_part)
+            original_name = rel.name
             # final directory mirrors the internal path under dest_root
-            final_dir = dest_root / (first_part.parent.relative_to(tmp_root))
-            final_dir.mkdir(parents=True, exist_ok=True)
-            final_path = final_dir / original_name
+            rel_dir = str(rel.parent)
+            final_dir = os.path.join(dest_long, rel_dir) if rel_dir != "." else dest_long
+            os.makedirs(final_dir, exist_ok=True)
+            final_long = os.path.join(final_dir, original_name)
+            display_path = str(rel)
+            final_path = os.path.join(dest_str, display_path)
         except Exception as exc:
             # print per-item failure and continue
             try:
-                print(f"Merging item {idx}/{total_items}: {key} - FAILED: {exc}", file=sys.stderr, flush=True)
+                print(f"Merging item {idx}/{total_items}: {os.path.join(*key)} - FAILED: {exc}", file=sys.stderr, flush=True)
             except Exception:
                 pass
-            log.errors.append(f"Failed to process {key}: {exc}")
-            continue
+            with lock:
+                log.errors.append(f"Failed to process {os.path.join(*key)}: {exc}")
+            return
 
         # print progress (in-place style)
-        try:
-            display_path = str(final_path.relative_to(dest_root))
-        except Exception:
-            display_path = str(final_path)
         try:
             print(f"\rMerging item {idx}/{total_items}: {display_path}", end="", file=sys.stderr, flush=True)
         except Exception:
             pass
 
         # Overwrite policy: fail if final exists
-        if final_path.exists():
+        if os.path.exists(final_long):
             try:
                 print(f"\rMerging item {idx}/{total_items}: {display_path} - SKIPPED (exists)", file=sys.stderr, flush=True)
             except Exception:
                 pass
-            log.skipped_existing.append(str(final_path))
-            log.errors.append(f"Final already exists (overwrite not allowed): {final_path}")
-            continue
+            with lock:
+                log.skipped_existing.append(final_path)
+                log.errors.append(f"Final already exists (overwrite not allowed): {final_path}")
+            return
 
         # Fast path: single staged part, avoid extra copy
         if len(parts) == 1:
             try:
-                os.replace(to_long_path(first_part), to_long_path(final_path))
-                log.merged.append((str(final_path), 1))
+                _move_file(first_part, final_long)
+                with lock:
+                    log.merged.append((final_path, 1))
                 try:
                     print(f"\rMerging item {idx}/{total_items}: {display_path} - OK", file=sys.stderr, flush=True)
                 except Exception:
                     pass
-                continue
+                return
             except Exception:
-                log.errors.append(f"Failed to copy a single staged part: {final_path}")
-                continue
+                with lock:
+                    log.errors.append(f"Failed to copy a single staged part: {final_path}")
+                return
 
         # tmp merge file lives under the temp directory to avoid collisions
-        tmp_merge = first_part.parent / (original_name + ".__merge_tmp")
+        tmp_merge = os.path.join(part_dir, original_name + ".__merge_tmp")
         try:
-            # Prepare plus-separated list for copy /b
-            parts_cmd = "+".join([f'"{to_long_path(p)}"' for p in parts])
-            cmd = f"cmd /c copy /b {parts_cmd} \"{to_long_path(tmp_merge)}\""
-            proc = subprocess.run(cmd, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-
-            # Verify or fallback
-            expected = sum(p.stat().st_size for p in parts)
-            actual = Path(tmp_merge).stat().st_size if Path(tmp_merge).exists() else 0
-            if proc.returncode != 0 or actual != expected:
-                try:
-                    Path(tmp_merge).unlink(missing_ok=True)
-                except Exception:
-                    pass
-                concat_parts_python(parts, tmp_merge)
-                actual = Path(tmp_merge).stat().st_size if Path(tmp_merge).exists() else 0
-                if actual != expected:
-                    raise ValueError(f"Merged size mismatch after fallback: expected={expected}, actual={actual}")
+            # sizes were recorded at extraction; no stat calls needed
+            expected = sum(size for _, _, size in staged)
+            actual = concat_parts(parts, tmp_merge, expected)
+            if actual != expected:
+                raise ValueError(f"Merged size mismatch: expected={expected}, actual={actual}")
 
             # Move into place
-            os.replace(to_long_path(tmp_merge), to_long_path(final_path))
-            log.merged.append((str(final_path), len(parts)))
+            _move_file(tmp_merge, final_long)
+            with lock:
+                log.merged.append((final_path, len(parts)))
 
-            # Cleanup parts
+            # Cleanup parts by name: a staging directory also holds parts of other
+            # outputs that may still be merging on another thread, so no scandir sweep
             for p in parts:
                 try:
-                    Path(p).unlink(missing_ok=True)
-                except Exception:
+                    os.unlink(p)
+                except OSError:
                     pass
 
             # final success print
@@ -273,45 +764,76 @@ def merge_parts(parts_map: Dict[str, List[Path]], dest_root: Path, log: SummaryL
                 print(f"\rMerging item {idx}/{total_items}: {display_path} - FAILED: {exc}", file=sys.stderr, flush=True)
             except Exception:
                 pass
-            log.errors.append(f"Failed to merge {final_path}: {exc}")
+            with lock:
+                log.errors.append(f"Failed to merge {final_path}: {exc}")
             try:
-                Path(tmp_merge).unlink(missing_ok=True)
-            except Exception:
+                os.unlink(tmp_merge)
+            except OSError:
                 pass
 
+    # Stream groups from the index (largest first) with a bounded number in flight
+    workers = jobs or min(MAX_MERGE_JOBS, os.cpu_count() or 1)
+    slots = threading.BoundedSemaphore(workers * 2)
+
+    def run(item: Tuple[int, Tuple[Tuple[str, str], List[Tuple[int, Path, int]]]]) -> None:
+        try:
+            merge_one(item)
+        except Exception as exc:
+            with lock:
+                log.errors.append(f"Failed to merge {os.path.join(*item[1][0])}: {exc}")
+        finally:
+            slots.release()
+
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        for item in enumerate(parts_index.groups(), start=1):
+            slots.acquire()
+            ex.submit(run, item)
+
 # Core processing from a list of zips
 
-def process_zips(zips: List[Path], user_encoding: str | None) -> int:
+def process_zips(zips: List[Path], user_encoding: str | None, jobs: int | None = None) -> int:
     if not zips:
         return 0
     zips.sort(key=zip_sort_key)
-    dest_root = Path(zips[0]).resolve().parent
+    # Resolve once here; everything below works from these absolute paths
+    zips = [Path(zp).resolve() for zp in zips]
+    dest_root = zips[0].parent
     dest_root.mkdir(parents=True, exist_ok=True)
     log = SummaryLog()
     ret = 0
+    tmp_root = dest_root / TMP_DIR_NAME
+    parts_index = None
     try:
         log.zips_processed = len(zips)
-        parts_map = stage_extract(zips, dest_root, log, user_encoding)
-        merge_parts(parts_map, dest_root, log)
+        parts_index = PartsIndex(tmp_root / PARTS_DB_NAME)
+        stage_extract(zips, dest_root, parts_index, log, user_encoding)
+        merge_parts(parts_index, dest_root, log, jobs)
     except Exception as exc:
         log.errors.append(f"Fatal error: {exc}")
         ret = 1
     finally:
+        # the index is scratch data; drop it before checking for leftovers
+        if parts_index is not None:
+            parts_index.close()
         try:
-            tmp_root = dest_root / TMP_DIR_NAME
-            if tmp_root.exists():
-                # Prune empty subdirectories bottom-up
-                dirs = sorted((d for d in tmp_root.rglob('*') if d.is_dir()), key=lambda d: len(d.relative_to(tmp_root).parts), reverse=True)
-                for d in dirs:
-                    try:
-                        if not any(d.iterdir()):
-                            os.rmdir(to_long_path(d))
-                    except Exception:
-                        pass
-                has_files = any(p.is_file() for p in tmp_root.rglob('*'))
-                has_dirs = any(p.is_dir() for p in tmp_root.rglob('*'))
-                if not has_files and not has_dirs:
-                    shutil.rmtree(to_long_path(tmp_root), ignore_errors=True)
+            tmp_long = to_long_path(tmp_root)
+            if os.path.isdir(tmp_long):
+                # One walk: count leftover files and record directories (parents first)
+                leftovers = 0
+                dirs: List[str] = []
+                for d, _, files in os.walk(tmp_long):
+                    leftovers += len(files)
+                    dirs.append(d)
+                if not leftovers:
+                    shutil.rmtree(tmp_long, ignore_errors=True)
+                else:
+                    # Keep staged files from failed merges; prune empty folders bottom-up
+                    print(f"Leaving {leftovers} staged file(s) under {tmp_root}", file=sys.stderr, flush=True)
+                    for d in reversed(dirs):
+                        try:
+                            os.rmdir(d)
+                        except OSError:
+                            pass
         except Exception:
             pass
         log.write(dest_root)
@@ -321,39 +843,40 @@ def process_zips(zips: List[Path], user_encoding: str | None) -> int:
 
 # Wrapper to process a directory containing zips
 
-def process_dir(dir_root: Path, user_encoding: str | None) -> int:
+def process_dir(dir_root: Path, user_encoding: str | None, jobs: int | None = None) -> int:
     zips: List[Path] = []
     if dir_root.is_dir():
-        for p in dir_root.iterdir():
-            if p.is_file() and p.suffix.lower() == ".zip" and p.name.lower().startswith(ZIP_NAME_PREFIX.lower()):
-                zips.append(p)
-    return process_zips(zips, user_encoding)
+        zips = scan_zip_dir(dir_root)
+    return process_zips(zips, user_encoding, jobs)
+
+# Picklable entry point for --set worker processes
+
+def _process_dir_job(job: Tuple[Path, str | None, int | None]) -> int:
+    return process_dir(*job)
 
 # Main
 
 def main(argv: List[str]) -> int:
     args = parse_args(argv)
-    ret = 0
     if args.set:
         set_root = Path(args.set)
         if not set_root.is_dir():
             print(f"Backup Set folder not found: {set_root}", file=sys.stderr)
             return 1
-        for child in set_root.iterdir():
-            if not child.is_dir():
-                continue
-            child_ret = process_dir(child, args.encoding)
-            if child_ret != 0:
-                ret = 1
-        return ret
+        children = [child for child in set_root.iterdir() if child.is_dir()]
+        if not children:
+            return 0
+        # Folders are independent; separate processes since each one is already multi-threaded
+        with ProcessPoolExecutor(max_workers=min(MAX_SET_JOBS, len(children), os.cpu_count() or 1)) as ex:
+            return max(ex.map(_process_dir_job, [(child, args.encoding, args.jobs) for child in children]))
     elif args.dir:
-        return process_dir(Path(args.dir), args.encoding)
+        return process_dir(Path(args.dir), args.encoding, args.jobs)
     else:
         zips = enumerate_zips(args)
         if not zips:
             print("No matching ZIPs provided.", file=sys.stderr)
             return 1
-        return process_zips(zips, args.encoding)
+        return process_zips(zips, args.encoding, args.jobs)
 
 if __name__ == "__main__":
     sys.exit(main(sys.argv[1:]))